@@ -2,8 +2,11 @@ import abc
 import math
 from numbers import Number
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+import itertools
 import threading
 import operator
+import os
 
 __percent_scale_factor = 100
 __ppm_scale_factor = 1_000_000
@@ -59,8 +62,13 @@ class ExcessiveErrorException(Exception):
                          f" {_REL_ERROR_FACTOR_LIMIT} ({decimal_to_percent(_REL_ERROR_FACTOR_LIMIT)}).")
 
 
-_GLOBAL_PROPAGATION_METHOD = threading.local()
-_GLOBAL_PROPAGATION_METHOD.p = None
+class _PropagatorLocal(threading.local):
+    # __init__ runs once per thread, so every thread starts without a propagator
+    def __init__(self):
+        self.p = None
+
+
+_GLOBAL_PROPAGATION_METHOD = _PropagatorLocal()
 
 
 def set_global_propagator(prop):
@@ -84,6 +92,45 @@ def propagation_context(prop):
     finally:
         set_global_propagator(old_prop)
 
+
+def _evaluate_chunk(func, prop, chunk):
+    with propagation_context(prop):
+        return [func(*args) for args in chunk]
+
+
+def parallel_map(func, *iterables, prop=None, max_workers=None, chunksize=None):
+    """Evaluate func over the zipped iterables on a thread pool, preserving order.
+
+    Every worker runs its chunk inside its own propagation_context. If prop is
+    None the calling thread's global propagator is used, since the thread local
+    propagator is not inherited by the pool threads. Errors raised by func,
+    e.g. for a missing propagator, are re-raised in the calling thread.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers < 1:
+        raise ValueError("max_workers must be greater than 0")
+    if chunksize is not None and chunksize < 1:
+        raise ValueError("chunksize must be greater than 0")
+
+    args = list(zip(*iterables))
+    if not args:
+        return []
+
+    if prop is None:
+        prop = get_global_propagator()
+    if chunksize is None:
+        chunksize = math.ceil(len(args) / max_workers)
+
+    chunks = [args[i:i + chunksize] for i in range(0, len(args), chunksize)]
+    if max_workers == 1 or len(chunks) == 1:
+        return _evaluate_chunk(func, prop, args)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+        results = executor.map(_evaluate_chunk, itertools.repeat(func), itertools.repeat(prop), chunks)
+        return list(itertools.chain.from_iterable(results))
+
+
 class ErrorPropagationMethod(abc.ABC):
 
     @abc.abstractmethod
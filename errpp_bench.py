@@ -0,0 +1,40 @@
+import os
+import random
+import sys
+import time
+import errpp
+
+# throughput of parallel_map against thread count, only scales on free-threaded builds
+N = 200_000
+SEED = 26
+THREAD_COUNTS = (1, 2, 4, 8, 16)
+
+
+def workload(a, b):
+    return (a * b + a) / (b - a)
+
+
+def main():
+    rng = random.Random(SEED)
+    lefts = [errpp.ValueWithError.from_val_abs_err_pair(rng.uniform(1, 100), rng.uniform(0, 0.1))
+             for _ in range(N)]
+    rights = [errpp.ValueWithError.from_val_abs_err_pair(rng.uniform(200, 300), rng.uniform(0, 0.1))
+              for _ in range(N)]
+
+    cores = os.cpu_count() or 1
+    gil = sys._is_gil_enabled() if hasattr(sys, "_is_gil_enabled") else True
+    print("Python {0}, GIL {1}, {2} cores, {3} evaluations".format(
+        sys.version.split()[0], "enabled" if gil else "disabled", cores, N))
+
+    base = None
+    for threads in THREAD_COUNTS:
+        start = time.perf_counter()
+        errpp.parallel_map(workload, lefts, rights, prop=errpp.StatisticalPropagation(), max_workers=threads)
+        rate = N / (time.perf_counter() - start)
+        base = base or rate
+        note = "  (oversubscribed)" if threads > cores else ""
+        print("{0:>2} threads: {1:>12,.0f} ops/s  ({2:.2f}x){3}".format(threads, rate, rate / base, note))
+
+
+if __name__ == '__main__':
+    main()
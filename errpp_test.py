@@ -2,6 +2,8 @@ import random, unittest, math, functools
 import abc
 import errpp
 import operator
+import threading
+import concurrent.futures
 
 def random_val_and_abs_error(min = -100, max = 100, max_rel_err_factor = 1):
     value = random.uniform(min, max)
@@ -261,10 +263,88 @@ class ValueWithErrorBasicTest(unittest.TestCase):
             self.assertEqual((2, 2, 1), (c.value, c.abs_err, c.rel_err))
         self.assertEqual(errpp.get_global_propagator(), cur_glob_prop)
 
+    def test_default_propagator_new_thread(self):
+        result = []
+        with errpp.propagation_context(errpp.WorstCasePropogation()):
+            t = threading.Thread(target=lambda: result.append(errpp.get_global_propagator()))
+            t.start()
+            t.join()
+        self.assertEqual(result, [None])
+
+
+class ParallelMapTest(unittest.TestCase):
+
+    def setUp(self):
+        self.pairs = [random_val_and_abs_error(1, 100, 0.5) for _ in range(1000)]
+        self.lefts = [errpp.ValueWithError.from_val_abs_err_pair(*p) for p in self.pairs]
+        self.rights = list(reversed(self.lefts))
+
+    def test_matches_serial(self):
+        for errtype in (errpp.StatisticalPropagation, errpp.WorstCasePropogation, errpp.ExtremePropagation):
+            with errpp.propagation_context(errtype()):
+                expected = [a * b + a for a, b in zip(self.lefts, self.rights)]
+            calculated = errpp.parallel_map(lambda a, b: a * b + a, self.lefts, self.rights,
+                                            prop=errtype(), max_workers=4, chunksize=7)
+            self.assertEqual([(x.value, x.abs_err) for x in expected],
+                             [(x.value, x.abs_err) for x in calculated])
+
+    def test_inherits_caller_propagator(self):
+        with errpp.propagation_context(errpp.WorstCasePropogation()):
+            calculated = errpp.parallel_map(operator.add, self.lefts, self.rights, max_workers=4)
+        for a, b, c in zip(self.lefts, self.rights, calculated):
+            self.assertEqual(c.abs_err, a.abs_err + b.abs_err)
+
+    def test_array_batches(self):
+        batches = [self.lefts[i:i + 10] for i in range(0, len(self.lefts), 10)]
+        with errpp.propagation_context(errpp.StatisticalPropagation()):
+            expected = [functools.reduce(operator.add, batch) for batch in batches]
+        calculated = errpp.parallel_map(lambda batch: functools.reduce(operator.add, batch), batches,
+                                        prop=errpp.StatisticalPropagation(), max_workers=4)
+        self.assertEqual([(x.value, x.abs_err) for x in expected],
+                         [(x.value, x.abs_err) for x in calculated])
+        # batches of values carrying their own prop need no global propagator
+        own = [[errpp.ValueWithError.from_val_abs_err_pair(v.value, v.abs_err, errpp.StatisticalPropagation())
+                for v in batch] for batch in batches]
+        with errpp.propagation_context(None):
+            calculated = errpp.parallel_map(lambda batch: functools.reduce(operator.add, batch), own, max_workers=4)
+        self.assertEqual([(x.value, x.abs_err) for x in expected],
+                         [(x.value, x.abs_err) for x in calculated])
+
+    def test_plain_numbers(self):
+        with errpp.propagation_context(None):
+            self.assertEqual(errpp.parallel_map(lambda x: x * 2, range(5), max_workers=4),
+                             list(map(lambda x: x * 2, range(5))))
+
+    def test_workers_restore_propagator(self):
+        # single worker runs inline, so a fresh pool thread must be back to None afterwards
+        with concurrent.futures.ThreadPoolExecutor(1) as executor:
+            executor.submit(errpp.parallel_map, operator.neg, self.lefts,
+                            prop=errpp.ExtremePropagation(), max_workers=1).result()
+            self.assertIsNone(executor.submit(errpp.get_global_propagator).result())
+
+    def test_empty_and_invalid(self):
+        self.assertEqual(errpp.parallel_map(operator.add, [], []), [])
+        with self.assertRaises(ValueError):
+            errpp.parallel_map(operator.neg, self.lefts, max_workers=0)
+        with self.assertRaises(ValueError):
+            errpp.parallel_map(operator.neg, self.lefts, chunksize=0)
+        with self.assertRaises(ValueError):
+            errpp.parallel_map(operator.neg, [], chunksize=0)
+
+    def test_missing_propagator(self):
+        with errpp.propagation_context(None):
+            with self.assertRaises(ValueError):
+                errpp.parallel_map(operator.add, self.lefts, self.rights, max_workers=4)
+            own = [errpp.ValueWithError.from_val_abs_err_pair(*p, errpp.WorstCasePropogation()) for p in self.pairs]
+            calculated = errpp.parallel_map(operator.add, own, own, max_workers=4)
+        self.assertEqual([c.abs_err for c in calculated], [2 * v.abs_err for v in own])
+
+
 class ErrorPropagation(unittest.TestSuite):
 
     def __init__(self):
-        self.addTests((RelationTest(), StatisticalErrorTest(), ExtremeErrorTest(), WorstCaseErrorTest(), ValueWithErrorBasicTest()))
+        self.addTests((RelationTest(), StatisticalErrorTest(), ExtremeErrorTest(), WorstCaseErrorTest(), ValueWithErrorBasicTest(),
+                       ParallelMapTest()))
 
 
 if __name__ == '__main__':